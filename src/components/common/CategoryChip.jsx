@@ -1,20 +1,6 @@
 import React from 'react';
 import { Chip } from '@mui/material';
-
-// Color mapping for categories
-const CATEGORY_COLORS = {
-  'security': '#e53935', // red
-  'bias': '#7b1fa2', // purple
-  'toxicity': '#d32f2f', // dark red
-  'hallucination': '#1565c0', // blue
-  'robustness': '#2e7d32', // green
-  'ethics': '#6a1b9a', // deep purple
-  'performance': '#0277bd', // light blue
-  'quality': '#00695c', // teal
-  'privacy': '#283593', // indigo
-  'safety': '#c62828', // darker red
-  'compliance': '#4527a0' // deep purple
-};
+import { CATEGORY_COLORS } from '../../constants/categoryColors';
 
 /**
  * A chip component for displaying test categories with appropriate colors
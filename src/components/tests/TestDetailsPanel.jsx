@@ -13,6 +13,10 @@ import SearchIcon from '@mui/icons-material/Search';
 import ViewModuleIcon from '@mui/icons-material/ViewModule';
 import ViewListIcon from '@mui/icons-material/ViewList';
 import WarningIcon from '@mui/icons-material/Warning';
+import { normalizeTestKey, normalizedKeysMatch } from '../../utils/testMatching';
+
+// Display order for the detail entries of a test case
+const DETAIL_TYPE_ORDER = { input: 1, output: 2, evaluation: 3 };
 
 // Component for Real-Time Test Details with enhanced UI
 const TestDetailsPanel = ({ testDetails, runningTests, selectedTestId }) => {
@@ -24,23 +28,10 @@ const TestDetailsPanel = ({ testDetails, runningTests, selectedTestId }) => {
   const [groupByCase, setGroupByCase] = useState(true);
   const detailsEndRef = useRef(null);
   
-  // Group test details by test ID
-  const groupedDetails = testDetails.reduce((groups, item) => {
-    if (!groups[item.testId]) {
-      groups[item.testId] = [];
-    }
-    groups[item.testId].push(item);
-    return groups;
-  }, {});
-  
-  // Group by case ID (when available)
-  const caseGroupedDetails = testDetails.reduce((groups, item) => {
-    const caseKey = item.caseId || `ungrouped_${item.timestamp}`;
-    if (!groups[caseKey]) {
-      groups[caseKey] = [];
-    }
-    groups[caseKey].push(item);
-    return groups;
+  // Count messages per type in a single pass for the tab badges
+  const typeCounts = testDetails.reduce((counts, item) => {
+    counts[item.type] = (counts[item.type] || 0) + 1;
+    return counts;
   }, {});
   
   // Auto-scroll logic
@@ -50,39 +41,32 @@ const TestDetailsPanel = ({ testDetails, runningTests, selectedTestId }) => {
     }
   }, [testDetails, autoScroll]);
   
-  // Filter test details based on active tab and search filter
-  const filteredDetails = testDetails.filter(item => {
+  // The selected test ID and search text are the same for every item, so
+  // normalize them once
+  const selectedIdNormalized = selectedTestId ? normalizeTestKey(selectedTestId) : '';
+  const filterLower = filter.toLowerCase();
+  
+  // Filter test details by active tab, selected test and search filter in one pass
+  const displayedDetails = testDetails.filter(item => {
     // Tab filter
     if (activeTab !== 'all' && item.type !== activeTab) return false;
     
+    // Selected test filter with fuzzy matching; checked before the search
+    // filter since it's cheaper than stringifying the content
+    if (selectedTestId && item.testId !== selectedTestId && 
+        !normalizedKeysMatch(normalizeTestKey(item.testId), selectedIdNormalized)) {
+      return false;
+    }
+    
     // Text search filter
     if (filter && !item.testId.includes(filter) && 
-        !JSON.stringify(item.content).toLowerCase().includes(filter.toLowerCase())) {
+        !JSON.stringify(item.content).toLowerCase().includes(filterLower)) {
       return false;
     }
     
     return true;
   });
   
-  // Add an additional filter for the selected test ID with fuzzy matching
-  const displayedDetails = selectedTestId 
-    ? filteredDetails.filter(item => {
-        // Helper function for string normalization (same as in TestSidebar)
-        const normalizeString = (str) => str.toString().toLowerCase().trim().replace(/[-_\s]+/g, '');
-        
-        // If exact match, return true immediately
-        if (item.testId === selectedTestId) return true;
-        
-        // Try fuzzy matching
-        const itemIdNormalized = normalizeString(item.testId);
-        const selectedIdNormalized = normalizeString(selectedTestId);
-        
-        // Check if either string contains the other
-        return itemIdNormalized.includes(selectedIdNormalized) || 
-               selectedIdNormalized.includes(itemIdNormalized);
-      })
-    : filteredDetails;
-  
   // Handle copying to clipboard
   const handleCopy = (text) => {
     navigator.clipboard.writeText(text);
@@ -278,7 +262,7 @@ const TestDetailsPanel = ({ testDetails, runningTests, selectedTestId }) => {
           <Tab label="All" value="all" />
           <Tab 
             label={
-              <Badge badgeContent={testDetails.filter(i => i.type === 'input').length} color="primary">
+              <Badge badgeContent={typeCounts.input || 0} color="primary">
                 Inputs
               </Badge>
             } 
@@ -286,7 +270,7 @@ const TestDetailsPanel = ({ testDetails, runningTests, selectedTestId }) => {
           />
           <Tab 
             label={
-              <Badge badgeContent={testDetails.filter(i => i.type === 'output').length} color="primary">
+              <Badge badgeContent={typeCounts.output || 0} color="primary">
                 Outputs
               </Badge>
             } 
@@ -294,7 +278,7 @@ const TestDetailsPanel = ({ testDetails, runningTests, selectedTestId }) => {
           />
           <Tab 
             label={
-              <Badge badgeContent={testDetails.filter(i => i.type === 'evaluation').length} color="primary">
+              <Badge badgeContent={typeCounts.evaluation || 0} color="primary">
                 Evaluations
               </Badge>
             } 
@@ -396,10 +380,9 @@ const TestDetailsPanel = ({ testDetails, runningTests, selectedTestId }) => {
                 }, {})
               ).map(([caseId, caseItems]) => {
                 // Sort items by type (input -> output -> evaluation)
-                const sortedItems = [...caseItems].sort((a, b) => {
-                  const typeOrder = { input: 1, output: 2, evaluation: 3 };
-                  return (typeOrder[a.type] || 99) - (typeOrder[b.type] || 99);
-                });
+                const sortedItems = [...caseItems].sort((a, b) => 
+                  (DETAIL_TYPE_ORDER[a.type] || 99) - (DETAIL_TYPE_ORDER[b.type] || 99)
+                );
                 
                 return (
                   <Paper 
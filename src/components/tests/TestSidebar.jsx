@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useMemo } from 'react';
 import { 
   Paper, 
   Box, 
@@ -14,22 +14,8 @@ import {
 import CheckCircleIcon from '@mui/icons-material/CheckCircle';
 import ErrorIcon from '@mui/icons-material/Error';
 import AccessTimeIcon from '@mui/icons-material/AccessTime';
-
-// Category colors (copy from RunTests.jsx)
-const CATEGORY_COLORS = {
-  'security': '#e53935',
-  'bias': '#7b1fa2',
-  'toxicity': '#d32f2f',
-  'hallucination': '#1565c0',
-  'robustness': '#2e7d32',
-  'ethics': '#6a1b9a',
-  'performance': '#0277bd',
-  'quality': '#00695c',
-  'privacy': '#283593',
-  'safety': '#c62828',
-  'compliance': '#4527a0',
-  'unknown': '#757575'
-};
+import { normalizeTestKey, normalizedKeysMatch } from '../../utils/testMatching';
+import { CATEGORY_COLORS } from '../../constants/categoryColors';
 
 /**
  * Component to display selected tests and their status in a sidebar
@@ -45,15 +31,31 @@ const TestSidebar = ({
   selectedTestId 
 }) => {
   
+  // Match test details to each selected test once per details update instead
+  // of re-normalizing every detail for every test on each lookup
+  const detailsByTest = useMemo(() => {
+    const normalizedDetails = testDetails.map(detail => ({
+      detail,
+      normalized: normalizeTestKey(detail.testId)
+    }));
+    
+    return selectedTests.reduce((byTest, testId) => {
+      const testIdNormalized = normalizeTestKey(testId);
+      byTest[testId] = normalizedDetails
+        .filter(({ detail, normalized }) => 
+          detail.testId === testId || normalizedKeysMatch(testIdNormalized, normalized)
+        )
+        .map(({ detail }) => detail);
+      return byTest;
+    }, {});
+  }, [selectedTests, testDetails]);
+  
   const handleSelectTest = (testId) => {
-    console.log("Test selected:", testId);
     onSelectTest(testId);
   };
   
   // Get test information from available tests and results
   const getTestInfo = (testId) => {
-    console.log("getTestInfo called for testId:", testId);
-    
     // Get test details from available tests
     const availableTest = availableTests?.find(test => test.id === testId);
     
@@ -64,36 +66,16 @@ const TestSidebar = ({
     const testName = availableTest?.name || testResult?.test_name || testId;
     
     // Prepare a normalized version of strings for more flexible matching
-    const normalizeString = (str) => str.toString().toLowerCase().trim().replace(/[-_\s]+/g, '');
-    const currentNameNormalized = currentTestName ? normalizeString(currentTestName) : '';
-    const testIdNormalized = normalizeString(testId);
-    const testNameNormalized = testName ? normalizeString(testName) : '';
+    const currentNameNormalized = currentTestName ? normalizeTestKey(currentTestName) : '';
+    const testIdNormalized = normalizeTestKey(testId);
+    const testNameNormalized = testName ? normalizeTestKey(testName) : '';
     
-    // Find test details that might match this test, even with partial ID matching
-    const matchingTestDetails = testDetails.filter(detail => {
-      if (detail.testId === testId) return true; // Exact match
-      
-      // Try partial/fuzzy matching
-      const detailIdNormalized = normalizeString(detail.testId);
-      return testIdNormalized.includes(detailIdNormalized) || 
-             detailIdNormalized.includes(testIdNormalized);
-    });
+    // Test details that might match this test, even with partial ID matching
+    const matchingTestDetails = detailsByTest[testId] || [];
     
     // Check if we have any matching details
     const hasDetails = matchingTestDetails.length > 0;
     
-    console.log("Test matching debug:", { 
-      currentTestName, 
-      currentNameNormalized, 
-      testId, 
-      testIdNormalized,
-      testName,
-      testNameNormalized,
-      runningTests,
-      hasDetails,
-      matchingTestDetails: matchingTestDetails.length
-    });
-    
     // Improved test status detection
     let status;
     if (testResult?.status) {
@@ -106,20 +88,16 @@ const TestSidebar = ({
         currentTestName === testId ||
         currentTestName === testName ||
         // Normalized fuzzy matches for more resilience
-        currentNameNormalized.includes(testIdNormalized) ||
-        testIdNormalized.includes(currentNameNormalized) ||
-        currentNameNormalized.includes(testNameNormalized) ||
-        testNameNormalized.includes(currentNameNormalized)
+        normalizedKeysMatch(currentNameNormalized, testIdNormalized) ||
+        normalizedKeysMatch(currentNameNormalized, testNameNormalized)
       )
     ) {
       // This test is currently running
       status = 'running';
-      console.log("Test status set to running for:", testId);
     } else if (runningTests && hasDetails) {
       // If tests are running and we have details for this test but no result yet
       // it's likely running or just completed
       status = 'running'; 
-      console.log("Test status set to running (has details) for:", testId);
     } else {
       // Otherwise, it's queued
       status = 'queued';
@@ -151,26 +129,18 @@ const TestSidebar = ({
   
   // Get message counts for each test
   const getTestMessageCounts = (testId) => {
-    // Normalize strings for matching
-    const normalizeString = (str) => str.toString().toLowerCase().trim().replace(/[-_\s]+/g, '');
-    const testIdNormalized = normalizeString(testId);
+    // Messages that match this test, with partial ID matching
+    const messages = detailsByTest[testId] || [];
     
-    // Find messages that match this test, with partial ID matching
-    const messages = testDetails.filter(detail => {
-      if (detail.testId === testId) return true; // Exact match
-      
-      // Try partial/fuzzy matching
-      const detailIdNormalized = normalizeString(detail.testId);
-      return testIdNormalized.includes(detailIdNormalized) || 
-             detailIdNormalized.includes(testIdNormalized);
+    // Count every message type in a single pass
+    const counts = { total: messages.length, inputs: 0, outputs: 0, evaluations: 0 };
+    messages.forEach(m => {
+      if (m.type === 'input') counts.inputs++;
+      else if (m.type === 'output') counts.outputs++;
+      else if (m.type === 'evaluation') counts.evaluations++;
     });
     
-    return {
-      total: messages.length,
-      inputs: messages.filter(m => m.type === 'input').length,
-      outputs: messages.filter(m => m.type === 'output').length,
-      evaluations: messages.filter(m => m.type === 'evaluation').length
-    };
+    return counts;
   };
 
   return (
@@ -229,7 +199,7 @@ const TestSidebar = ({
         
         {selectedTests.map(testId => {
           const testInfo = getTestInfo(testId);
-          const categoryColor = CATEGORY_COLORS[testInfo.category.toLowerCase()] || CATEGORY_COLORS.unknown;
+          const categoryColor = CATEGORY_COLORS[testInfo.category.toLowerCase()] || '#757575';
           const messageCounts = getTestMessageCounts(testId);
           
           return (
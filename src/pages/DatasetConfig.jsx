@@ -47,6 +47,10 @@ import {
   parseDatasetFile
 } from '../services/huggingFaceDatasetService';
 
+// Column names used to auto-detect the input and reference column mappings
+const INPUT_COLUMN_NAMES = new Set(['input', 'text', 'question', 'prompt', 'context']);
+const OUTPUT_COLUMN_NAMES = new Set(['output', 'target', 'label', 'answer', 'response']);
+
 // Tab panel component
 function TabPanel(props) {
   const { children, value, index, ...other } = props;
@@ -232,6 +236,12 @@ const DatasetConfig = () => {
         return updatedValues;
       });
       
+      // Start fetching samples alongside the dataset details; they don't depend
+      // on each other. The no-op catch keeps a failed sample request from being
+      // reported as unhandled if the info request fails first.
+      const samplesPromise = getDatasetSample(datasetId, formValues.split, 5, formValues.api_key);
+      samplesPromise.catch(() => {});
+      
       // Fetch dataset details
       const datasetInfo = await getDatasetInfo(datasetId, formValues.api_key);
       setSelectedDataset(datasetInfo);
@@ -248,9 +258,9 @@ const DatasetConfig = () => {
         });
       }
       
-      // Fetch samples
+      // Wait for samples
       try {
-        const samples = await getDatasetSample(datasetId, formValues.split, 5, formValues.api_key);
+        const samples = await samplesPromise;
         
         if (samples && samples.length > 0) {
           setDatasetSamples(samples);
@@ -262,11 +272,11 @@ const DatasetConfig = () => {
           // Auto-detect possible column mappings
           if (sampleColumns.length > 0) {
             const inputCol = sampleColumns.find(col => 
-              ['input', 'text', 'question', 'prompt', 'context'].includes(col.toLowerCase())
+              INPUT_COLUMN_NAMES.has(col.toLowerCase())
             ) || sampleColumns[0];
             
             const outputCol = sampleColumns.find(col => 
-              ['output', 'target', 'label', 'answer', 'response'].includes(col.toLowerCase())
+              OUTPUT_COLUMN_NAMES.has(col.toLowerCase())
             ) || (sampleColumns.length > 1 ? sampleColumns[1] : '');
             
             if (inputCol || outputCol) {
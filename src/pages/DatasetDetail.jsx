@@ -76,17 +76,22 @@ const DatasetDetail = () => {
       setDataset(datasetConfig);
       
       // If it's a Hugging Face dataset, fetch additional info
-      if (datasetConfig.source === 'huggingface') {
+      const loadAdditionalInfo = async () => {
+        if (datasetConfig.source !== 'huggingface') return;
+
         try {
           const info = await getDatasetInfo(datasetConfig.dataset_id, datasetConfig.api_key);
           setAdditionalInfo(info);
         } catch (infoError) {
           // Non-critical error, we can continue without additional info
         }
-      }
-      
-      // Load samples
-      await loadSamples(datasetConfig);
+      };
+
+      // Info and samples are independent, so request them concurrently
+      await Promise.all([
+        loadAdditionalInfo(),
+        loadSamples(datasetConfig)
+      ]);
     } catch (err) {
       setError(err.message);
     } finally {
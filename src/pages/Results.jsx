@@ -55,21 +55,7 @@ import PageLayout from '../components/layout/PageLayout';
 import Section from '../components/layout/Section';
 import testResultsService from '../services/testResultsService';
 import * as testsService from '../services/testsService';
-
-// Color mapping for categories
-const CATEGORY_COLORS = {
-  'security': '#e53935', // red
-  'bias': '#7b1fa2', // purple
-  'toxicity': '#d32f2f', // dark red
-  'hallucination': '#1565c0', // blue
-  'robustness': '#2e7d32', // green
-  'ethics': '#6a1b9a', // deep purple
-  'performance': '#0277bd', // light blue
-  'quality': '#00695c', // teal
-  'privacy': '#283593', // indigo
-  'safety': '#c62828', // darker red
-  'compliance': '#4527a0' // deep purple
-};
+import { CATEGORY_COLORS } from '../constants/categoryColors';
 
 const ResultsPage = () => {
   const navigate = useNavigate();
@@ -387,27 +373,21 @@ const ResultsPage = () => {
     
     // If we don't have explicit scores, try to calculate from results
     if (Object.keys(scores).length === 0 && effectiveResults) {
-      // Group tests by category
-      const categories = {};
+      // Count passed and total tests in a single pass; the overall score
+      // doesn't depend on how tests are split across categories
+      let totalPassed = 0;
+      let totalTests = 0;
       Object.values(effectiveResults).forEach(result => {
         if (result && result.test && result.result) {
-          const category = result.test.category || 'unknown';
-          if (!categories[category]) {
-            categories[category] = { total: 0, passed: 0 };
-          }
-          categories[category].total++;
+          totalTests++;
           if (result.result.pass) {
-            categories[category].passed++;
+            totalPassed++;
           }
         }
       });
       
-      // Calculate overall score from categories
-      if (Object.keys(categories).length > 0) {
-        const totalPassed = Object.values(categories).reduce((sum, cat) => sum + cat.passed, 0);
-        const totalTests = Object.values(categories).reduce((sum, cat) => sum + cat.total, 0);
-        
-        return totalTests > 0 ? (totalPassed / totalTests) * 100 : 0;
+      if (totalTests > 0) {
+        return (totalPassed / totalTests) * 100;
       }
     }
     
@@ -416,8 +396,12 @@ const ResultsPage = () => {
       return 0;
     }
     
-    const totalPassed = scoreValues.reduce((sum, score) => sum + (score?.passed || 0), 0);
-    const totalTests = scoreValues.reduce((sum, score) => sum + (score?.total || 0), 0);
+    let totalPassed = 0;
+    let totalTests = 0;
+    scoreValues.forEach(score => {
+      totalPassed += score?.passed || 0;
+      totalTests += score?.total || 0;
+    });
     
     return totalTests > 0 ? (totalPassed / totalTests) * 100 : 0;
   };
@@ -47,25 +47,12 @@ import { createModelAdapter } from '../services/modelAdapter';
 import { getSavedModelConfigs, getModelConfigById, saveModelTestResults } from '../services/modelStorageService';
 import websocketService from '../services/websocketService';
 import testResultsService from '../services/testResultsService';
+import { normalizeTestKey, normalizedKeysMatch } from '../utils/testMatching';
+import { CATEGORY_COLORS } from '../constants/categoryColors';
 
 // Extract the TESTS_API_URL from environment for direct API calls
 const TESTS_API_URL = import.meta.env.VITE_TESTS_API_URL || 'http://localhost:8000';
 
-// Color mapping for categories
-const CATEGORY_COLORS = {
-  'security': '#e53935', // red
-  'bias': '#7b1fa2', // purple
-  'toxicity': '#d32f2f', // dark red
-  'hallucination': '#1565c0', // blue
-  'robustness': '#2e7d32', // green
-  'ethics': '#6a1b9a', // deep purple
-  'performance': '#0277bd', // light blue
-  'quality': '#00695c', // teal
-  'privacy': '#283593', // indigo
-  'safety': '#c62828', // darker red
-  'compliance': '#4527a0' // deep purple
-};
-
 const RunTestsPage = () => {
   const navigate = useNavigate();
   const location = useLocation();
@@ -405,6 +392,15 @@ const RunTestsPage = () => {
       addLog(`Preparing test configuration with model ID: ${testConfig.model_id}`);
       
       try {
+        // Test run ID assigned by the WebSocket; set once the connection is established
+        let activeRunId = null;
+        
+        // Normalize the selected test IDs once per run rather than on every message
+        const normalizedSelectedTests = selectedTests.map(id => ({
+          id,
+          normalized: normalizeTestKey(id)
+        }));
+        
         // Create a reusable handler function that processes any message type
         const processMessage = (data) => {
           // If data doesn't have a type but is a string, try to parse it
@@ -424,14 +420,13 @@ const RunTestsPage = () => {
             if (!testId) return testId;
             
             // Find the matching test from selectedTests if possible
-            const originalTestId = selectedTests.find(id => {
-              const idNorm = id.toLowerCase().replace(/[-_\s]+/g, '');
-              const testIdNorm = testId.toLowerCase().replace(/[-_\s]+/g, '');
-              return idNorm.includes(testIdNorm) || testIdNorm.includes(idNorm);
-            });
+            const testIdNorm = normalizeTestKey(testId);
+            const originalTest = normalizedSelectedTests.find(({ normalized }) => 
+              normalizedKeysMatch(normalized, testIdNorm)
+            );
             
             // Return the original test ID from selectedTests if found, otherwise the input test ID
-            return originalTestId || testId;
+            return originalTest ? originalTest.id : testId;
           };
           
           // Use switch statement to handle message types
@@ -440,18 +435,10 @@ const RunTestsPage = () => {
               // Handle test status updates
               const { progress, current_test, test_stats } = data;
               
-              // Add debug logs before any conditional checks
-              console.log("===== TEST STATUS UPDATE MESSAGE RECEIVED =====");
-              console.log("Data received:", data);
-              console.log("Current runningTests state:", runningTests);
-              console.log("Current selectedTests:", selectedTests);
-              
               if (progress) {
                 setTestProgress(progress);
               }
               if (current_test) {
-                console.log("TEST STATUS UPDATE - received current_test:", current_test);
-                console.log("TEST STATUS UPDATE - test IDs to compare:", selectedTests);
                 setCurrentTestName(current_test);
               }
               if (test_stats) {
@@ -461,9 +448,6 @@ const RunTestsPage = () => {
               
             case 'test_progress':
               // Handle test progress updates
-              console.log("===== TEST PROGRESS MESSAGE RECEIVED =====");
-              console.log("Data received:", data);
-              
               // Extract the test ID and status, normalizing the test ID
               const progressTestId = normalizeTestId(data.test_id);
               const progressStatus = data.status;
@@ -471,14 +455,12 @@ const RunTestsPage = () => {
               if (progressTestId && progressStatus === 'running') {
                 // Update current test name to reflect what's running
                 setCurrentTestName(progressTestId);
-                console.log("TEST PROGRESS - set current test to:", progressTestId);
               }
               
               // Update progress if available
               if (data.current && data.total && data.total > 0) {
                 const calculatedProgress = data.current / data.total;
                 setTestProgress(calculatedProgress);
-                console.log("TEST PROGRESS - updated progress:", calculatedProgress);
               }
               break;
               
@@ -530,10 +512,14 @@ const RunTestsPage = () => {
                 // If we're receiving individual test results, also construct a proper results object
                 // and save it to context immediately (don't wait for test_complete)
                 if (newResults.length > 0) {
-                  // Format results for context using the same structure as in processTestResults
+                  // Format results for context using the same structure as in processTestResults,
+                  // tallying the category scores in the same pass (test IDs are unique here)
                   const resultsObject = {};
+                  const scoresData = {};
                   newResults.forEach(result => {
                     if (result && result.test_id) {
+                      const passed = result.status === 'success' || result.status === 'passed';
+                      
                       // Format expected by Results page
                       resultsObject[result.test_id] = {
                         test: {
@@ -544,7 +530,7 @@ const RunTestsPage = () => {
                           severity: result.severity || 'medium'
                         },
                         result: {
-                          pass: result.status === 'success' || result.status === 'passed',
+                          pass: passed,
                           score: result.score,
                           message: result.message || (result.status === 'success' ? 'Test passed successfully' : 'Test failed'),
                           details: result.analysis || {},
@@ -553,29 +539,26 @@ const RunTestsPage = () => {
                           timestamp: result.created_at || new Date().toISOString()
                         }
                       };
+                      
+                      // Calculate scores from results
+                      const category = result.test_category;
+                      if (category) {
+                        if (!scoresData[category]) {
+                          scoresData[category] = { total: 0, passed: 0 };
+                        }
+                        
+                        scoresData[category].total++;
+                        if (passed) {
+                          scoresData[category].passed++;
+                        }
+                      }
                     }
                   });
                   
-                  // Calculate scores from results
-                  const scoresData = {};
-                  Object.values(resultsObject).forEach(item => {
-                    if (!item || !item.test || !item.test.category) return;
-                    
-                    const category = item.test.category;
-                    if (!scoresData[category]) {
-                      scoresData[category] = { total: 0, passed: 0 };
-                    }
-                    
-                    scoresData[category].total++;
-                    if (item.result && item.result.pass) {
-                      scoresData[category].passed++;
-                    }
-                  });
-                  
-                  // Save the current taskId so we can retrieve it when the test completes
-                  if (taskId) {
+                  // Save the current run ID so we can retrieve it when the test completes
+                  if (activeRunId) {
                     // Save to database using the dedicated service
-                    testResultsService.saveResults(taskId, resultsObject, scoresData)
+                    testResultsService.saveResults(activeRunId, resultsObject, scoresData)
                       .then(savedRecord => {
                         // Success - no need to log
                       })
@@ -586,7 +569,7 @@ const RunTestsPage = () => {
                   
                   // Update state with the formatted results object
                   setTestResultsDataSource({
-                    taskId: taskId,
+                    taskId: activeRunId,
                     results: resultsObject,
                     scores: scoresData
                   });
@@ -606,7 +589,7 @@ const RunTestsPage = () => {
               setTestComplete(true);
               
               // Extract test run ID from the response
-              const taskId = data.task_id || data.id || data.test_run_id;
+              const completedTaskId = data.task_id || data.id || data.test_run_id;
               
               // Initialize results object
               let resultsForNavigation = {};
@@ -657,14 +640,14 @@ const RunTestsPage = () => {
                 
                 // Also save to database for future retrieval
                 if (typeof testResultsService !== 'undefined' && testResultsService.saveResults) {
-                  testResultsService.saveResults(taskId, resultsForNavigation, scoresForNavigation)
+                  testResultsService.saveResults(completedTaskId, resultsForNavigation, scoresForNavigation)
                     .then(() => {})
                     .catch(error => {});
                 }
                 
                 // Prepare data for navigation
                 const navigationState = {
-                  taskId,
+                  taskId: completedTaskId,
                   results: resultsForNavigation,
                   scores: scoresForNavigation
                 };
@@ -674,7 +657,7 @@ const RunTestsPage = () => {
                 // Display a success message in the UI
                 setError(`Tests completed successfully!`);
                 setErrorSeverity('success');
-                setCurrentTask(taskId);
+                setCurrentTask(completedTaskId);
               } else {
                 setError('No test results were found in the response. Please try again.');
                 setErrorSeverity('error');
@@ -757,20 +740,12 @@ const RunTestsPage = () => {
           }
         };
         
-        // Register message handlers BEFORE connecting to WebSocket
-        // Use persistentOn instead of on to keep handlers across resets/reconnections
+        // Register the message handler BEFORE connecting to WebSocket
+        // Use persistentOn instead of on to keep handlers across resets/reconnections.
+        // Every message is emitted as a 'message' event and processMessage switches
+        // on its type, so registering for the typed events as well would handle
+        // each message more than once.
         websocketService.persistentOn('message', processMessage);
-        websocketService.persistentOn('test_status_update', processMessage);
-        websocketService.persistentOn('test_progress', processMessage);
-        websocketService.persistentOn('test_result', processMessage);
-        websocketService.persistentOn('test_complete', processMessage);
-        websocketService.persistentOn('test_failed', processMessage);
-        websocketService.persistentOn('test_started', processMessage);
-        
-        // Add handlers for the test detail messages
-        websocketService.persistentOn('model_input', processMessage);
-        websocketService.persistentOn('model_output', processMessage);
-        websocketService.persistentOn('evaluation_result', processMessage);
         
         // STEP 1: First connect to WebSocket without a task ID to get a new test run ID
         addLog('Connecting to WebSocket to get test run ID...');
@@ -782,6 +757,7 @@ const RunTestsPage = () => {
         }
         
         const testRunId = wsResponse.test_run_id;
+        activeRunId = testRunId;
         addLog(`Received test run ID from WebSocket: ${testRunId}`);
         
         // STEP 2: Now run the tests using the test run ID from the WebSocket
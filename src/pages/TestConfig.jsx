@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import { useNavigate } from 'react-router-dom';
 import {
   Box,
@@ -89,6 +89,21 @@ const TestConfigPage = () => {
     }
   }, [selectedTests]);
   
+  // Index available tests by category so per-category lookups don't rescan every test
+  const testsByCategory = useMemo(() => {
+    const index = {};
+    if (Array.isArray(availableTests)) {
+      availableTests.forEach(test => {
+        if (!test) return;
+        if (!index[test.category]) {
+          index[test.category] = [];
+        }
+        index[test.category].push(test);
+      });
+    }
+    return index;
+  }, [availableTests]);
+  
   // Fetch categories from available tests
   useEffect(() => {
     // Extract unique categories from available tests
@@ -150,15 +165,13 @@ const TestConfigPage = () => {
     
     const newSelectAllState = {};
     categories.forEach(category => {
-      const testsInCategory = availableTests
-        .filter(test => test.category === category)
-        .map(test => test.id);
+      const testsInCategory = (testsByCategory[category] || []).map(test => test.id);
       
       const selectedInCategory = testsInCategory.filter(id => localSelectedTests.includes(id));
       newSelectAllState[category] = selectedInCategory.length === testsInCategory.length && testsInCategory.length > 0;
     });
     setSelectAllInCategory(newSelectAllState);
-  }, [localSelectedTests, categories, availableTests]);
+  }, [localSelectedTests, categories, availableTests, testsByCategory]);
   
   const handleTabChange = (event, newValue) => {
     setCurrentTab(newValue);
@@ -179,9 +192,7 @@ const TestConfigPage = () => {
       return;
     }
     
-    const testsInCategory = availableTests
-      .filter(test => test.category === category)
-      .map(test => test.id);
+    const testsInCategory = (testsByCategory[category] || []).map(test => test.id);
     
     setLocalSelectedTests(prev => {
       if (selectAllInCategory[category]) {
@@ -643,10 +654,8 @@ const TestConfigPage = () => {
       );
     }
     
-    // Filter tests for this category
-    const testsInCategory = availableTests.filter(test => 
-      test && test.category === category
-    );
+    // Look up tests for this category
+    const testsInCategory = testsByCategory[category] || [];
     
     // Filter tests for compatibility with model type if needed
     const filteredTests = category === 'NLP-Specific' && 
@@ -97,10 +97,11 @@ export const getDatasetSample = async (datasetId, split = 'test', count = 10, ap
     // Trying alternative approaches - some datasets use different splits
     const splitOptions = ['train', 'validation', 'test', 'dev'];
     
-    // Try other common split names if the requested one failed
-    for (const alternateSplit of splitOptions) {
-      if (alternateSplit === split) continue; // Skip the one we already tried
-      
+    // Try other common split names if the requested one failed. The requests
+    // are independent, so start them together and return the first success in
+    // preference order without waiting on the slower ones.
+    const alternateSplits = splitOptions.filter(alternateSplit => alternateSplit !== split);
+    const probes = alternateSplits.map(async (alternateSplit) => {
       try {
         const url = `${HF_API_URL}/datasets/${datasetId}/sample?split=${alternateSplit}&n=${count}`;
         const response = await fetch(url, {
@@ -111,11 +112,18 @@ export const getDatasetSample = async (datasetId, split = 'test', count = 10, ap
         });
         
         if (response.ok) {
-          const data = await response.json();
-          return data;
+          return { data: await response.json() };
         }
       } catch (err) {
-        // Continue with next split option
+        // Fall through to the next split option
+      }
+      return null;
+    });
+    
+    for (const probe of probes) {
+      const probeResult = await probe;
+      if (probeResult) {
+        return probeResult.data;
       }
     }
     
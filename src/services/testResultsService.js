@@ -59,6 +59,8 @@ const isDatabaseAvailable = () => {
 
 /**
  * Save test results to the database
+ * Results for a task ID that already has a record replace that record, so
+ * incremental saves during a run don't accumulate one snapshot per update.
  * @param {string} taskId - The task ID associated with the results
  * @param {Object} results - The test results data
  * @param {Object} scores - Optional compliance scores
@@ -84,16 +86,30 @@ const saveResults = async (taskId, results, scores = {}) => {
         timestamp: new Date().toISOString(),
       };
       
-      // Add to the store
-      const request = store.add(record);
+      // Look up an existing record for this task to overwrite in place
+      const keyRequest = store.index(TASK_ID_INDEX).getKey(taskId);
       
-      request.onsuccess = (event) => {
-        // Update the record with the generated ID
-        record.id = event.target.result;
-        resolve(record);
+      keyRequest.onsuccess = (event) => {
+        const existingId = event.target.result;
+        if (existingId !== undefined) {
+          record.id = existingId;
+        }
+        
+        // Add to the store, or replace the existing record
+        const request = store.put(record);
+        
+        request.onsuccess = (event) => {
+          // Update the record with the generated ID
+          record.id = event.target.result;
+          resolve(record);
+        };
+        
+        request.onerror = (event) => {
+          reject(event.target.error);
+        };
       };
       
-      request.onerror = (event) => {
+      keyRequest.onerror = (event) => {
         reject(event.target.error);
       };
       
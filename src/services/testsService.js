@@ -15,8 +15,9 @@ const fetchOptions = {
   }
 };
 
-// Add a cache for test results
+// Add a cache for test results, kept in least-recently-used order
 const testResultsCache = new Map();
+const TEST_RESULTS_CACHE_SIZE = 10;
 
 // Add a count for consecutive identical results
 let consecutiveIdenticalResults = 0;
@@ -101,17 +102,10 @@ export const runTests = async (testIds, modelConfig, testParameters = {}, logCal
       throw new Error('No model configuration provided');
     }
 
-    console.log('🚀 TEST SERVICE: Running tests with:', {
-      testIds,
-      modelConfig: {...modelConfig, api_key: '***REDACTED***'},
-      testParameters
-    });
-
     const log = (message) => {
       if (logCallback && typeof logCallback === 'function') {
         logCallback(message);
       }
-      console.log(`📝 TEST SERVICE LOG: ${message}`);
     };
 
     log('Preparing to run tests...');
@@ -159,9 +153,6 @@ export const runTests = async (testIds, modelConfig, testParameters = {}, logCal
     }
 
     log('Sending request to API...');
-    console.log('📤 TEST SERVICE: API Request payload:', JSON.stringify(payload, (key, value) => 
-      key === 'api_key' ? '***REDACTED***' : value
-    ));
 
     const response = await fetch(`${API_BASE_URL}/api/tests/run`, {
       method: 'POST',
@@ -183,12 +174,10 @@ export const runTests = async (testIds, modelConfig, testParameters = {}, logCal
 
     const data = await response.json();
     log('API response received');
-    console.log('📥 TEST SERVICE: API Response data:', data);
 
     if (data && (data.task_id || data.test_run_id)) {
       const taskId = data.task_id || data.test_run_id;
       log(`Tests initiated with task ID: ${taskId}`);
-      console.log('✅ TEST SERVICE: Got task ID:', taskId);
       return taskId;
     } else {
       console.error('❌ TEST SERVICE: No task ID in response:', data);
@@ -311,6 +300,10 @@ export const getTestResults = async (taskId) => {
     if (testResultsCache.has(taskId)) {
       const cachedResults = testResultsCache.get(taskId);
       
+      // Re-insert so the entry becomes the most recently used
+      testResultsCache.delete(taskId);
+      testResultsCache.set(taskId, cachedResults);
+      
       // Log cache hit
       console.log('🔍 TEST RESULTS: Cache hit for task:', taskId);
       
@@ -336,14 +329,9 @@ export const getTestResults = async (taskId) => {
     // Cache the results
     testResultsCache.set(taskId, data);
     
-    // Check for consecutive identical results and clear cache if needed
-    if (testResultsCache.size > 10) {
-      console.log('🧹 TEST RESULTS: Cache cleanup, removing oldest entries');
-      // Get all entries and sort by timestamp
-      const entries = Array.from(testResultsCache.entries());
-      const oldestEntries = entries.slice(0, entries.length - 10);
-      // Remove oldest entries
-      oldestEntries.forEach(([key]) => testResultsCache.delete(key));
+    // Evict the least recently used entries; Map iterates in insertion order
+    while (testResultsCache.size > TEST_RESULTS_CACHE_SIZE) {
+      testResultsCache.delete(testResultsCache.keys().next().value);
     }
     
     return data;
@@ -107,17 +107,6 @@ class WebSocketService {
         };
         
         this.ws.onmessage = (event) => {
-          // Log every single raw message received
-          console.log('📩 WEBSOCKET RAW MESSAGE RECEIVED:', event.data);
-          
-          // Always log the message type to diagnose message format issues
-          try {
-            const rawData = JSON.parse(event.data);
-            console.log(`📩 WEBSOCKET MESSAGE TYPE: ${rawData.type || 'NO_TYPE'}`);
-          } catch (e) {
-            console.log('📩 WEBSOCKET NON-JSON MESSAGE:', event.data);
-          }
-          
           // First, emit the raw message event with the raw data
           this.notifyListeners('raw_message', event.data);
           
@@ -125,43 +114,6 @@ class WebSocketService {
             // Try to parse the message as JSON
             const data = JSON.parse(event.data);
             
-            console.log('📩 WEBSOCKET PARSED MESSAGE:', {
-              type: data.type,
-              timestamp: data.timestamp,
-              message: data
-            });
-            
-            // Log all raw messages to console
-            console.log('[WebSocket Raw Message]:', data);
-            
-            // Log specific message types
-            if (data.type === 'model_input') {
-              console.log('[WebSocket Model Input]:', {
-                test_id: data.test_id,
-                prompt_type: data.prompt_type,
-                prompt: data.prompt
-              });
-            } 
-            else if (data.type === 'model_output') {
-              console.log('[WebSocket Model Output]:', {
-                test_id: data.test_id,
-                output: data.output
-              });
-            }
-            else if (data.type === 'evaluation_result') {
-              console.log('[WebSocket Evaluation Result]:', {
-                test_id: data.test_id,
-                evaluation: data.evaluation
-              });
-            }
-            else if (data.type === 'issue_found') {
-              console.log('[WebSocket Issue Found]:', {
-                test_id: data.test_id,
-                issue_type: data.issue_type,
-                details: data.details
-              });
-            }
-            
             // Always emit a generic 'message' event with the full data
             this.notifyListeners('message', data);
             
@@ -175,12 +127,6 @@ class WebSocketService {
             // Then check for a message type and emit a specific event if present
             if (data.type) {
               this.notifyListeners(data.type, data);
-              
-              // Special handling for test_complete messages to ensure they're processed
-              if (data.type === 'test_complete') {
-                // Also notify as a 'message' event to make sure it's processed even if specific listeners aren't working
-                this.notifyListeners('message', data);
-              }
             }
           } catch (error) {
             // If parsing fails, still emit the message event with the raw data
@@ -253,17 +199,6 @@ class WebSocketService {
       return;
     }
     
-    const listenerCount = listeners.length;
-    
-    // Create a data preview for debugging
-    let dataPreview = '';
-    try {
-      const strData = JSON.stringify(data);
-      dataPreview = strData.length > 100 ? `${strData.substring(0, 100)}...` : strData;
-    } catch (e) {
-      // Ignore stringify errors
-    }
-    
     // Call each listener
     for (let index = 0; index < listeners.length; index++) {
       const callback = listeners[index];
@@ -283,17 +218,11 @@ class WebSocketService {
    * @returns {Function} - A function to remove the listener
    */
   on(type, callback, persistent = false) {
-    // Create a copy of the callback with tracking information
+    // Create a copy of the callback with the tracking information off() needs
     const trackedCallback = (...args) => callback(...args);
     trackedCallback._trackingId = Date.now() + Math.random().toString(36).substring(2, 7);
-    trackedCallback._registeredAt = new Date().toISOString();
-    trackedCallback._listenerType = type;
     trackedCallback._persistent = persistent;
     
-    // Store extra tracking data on the stack trace
-    const stack = new Error().stack;
-    trackedCallback._stackTrace = stack;
-    
     // Ensure the event type exists in the eventListeners object
     if (!this.eventListeners[type]) {
       this.eventListeners[type] = [];
@@ -326,7 +255,6 @@ class WebSocketService {
     
     const listeners = this.eventListeners[type];
     const callbackId = callback._trackingId || 'untracked';
-    const registeredAt = callback._registeredAt || 'unknown';
     const isPersistent = callback._persistent || false;
     
     // Find the callback in the listeners array
@@ -0,0 +1,24 @@
+/**
+ * Utility functions for matching test identifiers
+ * Test IDs reported by the backend don't always match the configured IDs
+ * exactly (casing, separators, prefixes), so matching is done on normalized keys.
+ */
+
+/**
+ * Normalize a test ID or name for fuzzy matching
+ * @param {string} value - Test ID or name
+ * @returns {string} Lowercase key with dashes, underscores and whitespace removed
+ */
+export function normalizeTestKey(value) {
+  return value.toString().toLowerCase().trim().replace(/[-_\s]+/g, '');
+}
+
+/**
+ * Check whether two normalized keys refer to the same test
+ * @param {string} a - Normalized key
+ * @param {string} b - Normalized key
+ * @returns {boolean} Whether either key contains the other
+ */
+export function normalizedKeysMatch(a, b) {
+  return a.includes(b) || b.includes(a);
+}